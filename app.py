@@ -1,120 +1,113 @@
 import streamlit as st
-from datetime import datetime, timedelta
+from datetime import datetime
 import re
+from importlib.util import find_spec
 from io import BytesIO
-import base64
-from docx import Document
-from docx.shared import Inches, Pt
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.style import WD_STYLE_TYPE
-
-# For PDF generation
-try:
-    from reportlab.lib.pagesizes import A4
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    from reportlab.lib import colors
-    from reportlab.platypus.tableofcontents import TableOfContents
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
-
-# For Word generation
-try:
-    from docx import Document
-    from docx.shared import Inches, Pt
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
-    from docx.enum.style import WD_STYLE_TYPE
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
-
-def add_signature_section_to_docx(doc, contract_data):
-    """Add signature section to Word document"""
-    doc.add_paragraph()
-    doc.add_paragraph("IN WITNESS WHEREOF, the Parties have executed this Agreement on the date first written above.")
-    doc.add_paragraph()
-    
-    doc.add_paragraph("SIGNED AT _________________________ ON _________________________")
-    doc.add_paragraph()
-    
-    # Company signature
-    doc.add_paragraph("THE COMPANY:")
-    doc.add_paragraph()
-    doc.add_paragraph("_________________________________")
-    doc.add_paragraph(f"{contract_data['company_rep']}")
-    doc.add_paragraph(f"{contract_data['company_position']}")
-    doc.add_paragraph(f"{contract_data['company_name']}")
-    doc.add_paragraph()
-    
-    doc.add_paragraph("WITNESS:")
-    doc.add_paragraph()
-    doc.add_paragraph("_________________________________")
-    doc.add_paragraph("Full Name:")
-    doc.add_paragraph("Date:")
-    doc.add_paragraph()
-    
-    # Recipient signature
-    doc.add_paragraph("THE RECIPIENT:")
-    doc.add_paragraph()
-    doc.add_paragraph("_________________________________")
-    doc.add_paragraph(f"{contract_data['other_name']}")
-    if contract_data['other_id']:
-        doc.add_paragraph(f"ID Number: {contract_data['other_id']}")
-    doc.add_paragraph()
-    
-    doc.add_paragraph("WITNESS:")
-    doc.add_paragraph()
-    doc.add_paragraph("_________________________________")
-    doc.add_paragraph("Full Name:")
-    doc.add_paragraph("Date:")
-    doc.add_paragraph()
-    
-    # Legal disclaimer
-    doc.add_page_break()
-    disclaimer_para = doc.add_paragraph()
-    disclaimer_run = disclaimer_para.add_run("LEGAL DISCLAIMER:")
-    disclaimer_run.bold = True
-    disclaimer_para.add_run(" This NDA has been generated to comply with South African law as of 2024. However, legal requirements may change, and specific circumstances may require additional provisions. It is recommended to have this agreement reviewed by a qualified South African attorney before execution.")
+from types import SimpleNamespace
+from xml.sax.saxutils import escape
+
+# PDF and Word export depend on optional packages that are heavy to import, so only
+# probe for them here and import them the first time a document is generated
+PDF_AVAILABLE = find_spec("reportlab") is not None
+DOCX_AVAILABLE = find_spec("docx") is not None
+
+_RL = None
+_DOCX = None
+
+def _reportlab():
+    """Import the ReportLab names used for PDF generation on first use"""
+    global _RL
+    if _RL is None:
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
+        _RL = SimpleNamespace(
+            colors=colors,
+            A4=A4,
+            getSampleStyleSheet=getSampleStyleSheet,
+            ParagraphStyle=ParagraphStyle,
+            SimpleDocTemplate=SimpleDocTemplate,
+            Paragraph=Paragraph,
+            Spacer=Spacer,
+            PageBreak=PageBreak
+        )
+    return _RL
+
+def _python_docx():
+    """Import the python-docx names used for Word generation on first use"""
+    global _DOCX
+    if _DOCX is None:
+        from docx import Document
+        from docx.oxml import parse_xml
+        _DOCX = SimpleNamespace(Document=Document, parse_xml=parse_xml)
+    return _DOCX
+
+_ALPHA_LABELS = tuple(f"({chr(ord('a') + i)})" for i in range(16))
+
+_EXCEPTIONS = (
+    "Is or becomes publicly available through no breach of this Agreement by the Recipient;",
+    "Was rightfully known by the Recipient before disclosure by the Company;",
+    "Is rightfully received by the Recipient from a third party without breach of any confidentiality obligation;",
+    "Is independently developed by the Recipient without use of or reference to the Confidential Information;",
+    "Is required to be disclosed by law, regulation, or court order, provided that the Recipient gives the Company reasonable advance notice of such requirement."
+)
+
+_CONTRACT_TYPES = ("Employee NDA", "Contractor NDA", "Mutual NDA")
+
+# South African legislation cited in the recitals
+_SA_LEGAL_ACTS = "the Constitution of South Africa (1996), Labour Relations Act 66 of 1995, Basic Conditions of Employment Act 75 of 1997, Protection of Personal Information Act 4 of 2013, Competition Act 89 of 1998, and Protected Disclosures Act 26 of 2000"
+
+# WHEREAS recitals, fully interpolated once per contract type
+_RECITALS_BY_TYPE = {
+    contract_type: (
+        "WHEREAS, the Company possesses certain confidential and proprietary information, trade secrets, and intellectual property that constitute valuable business assets;",
+        f"WHEREAS, the Recipient {'is employed by' if contract_type == 'Employee NDA' else 'will be engaged by'} the Company and will have access to such confidential information in the course of {'employment' if contract_type == 'Employee NDA' else 'the engagement'};",
+        f"WHEREAS, the Parties wish to protect the confidentiality of such information in accordance with the laws of the Republic of South Africa, including but not limited to {_SA_LEGAL_ACTS};"
+    )
+    for contract_type in _CONTRACT_TYPES
+}
+
+_SCALES = (
+    (1_000_000_000, "Billion"),
+    (1_000_000, "Million"),
+    (1_000, "Thousand"),
+    (1, "")
+)
 
 def amount_in_words(amount):
     """Convert numeric amount to words (enhanced version)"""
-    if amount == 0:
-        return "Zero"
-    
-    # Handle thousands
-    if amount < 1000:
-        return str(amount)
-    elif amount < 10000:
-        thousands = amount // 1000
-        remainder = amount % 1000
-        if remainder == 0:
-            return f"{thousands} Thousand"
-        else:
-            return f"{thousands} Thousand {remainder}"
-    elif amount < 100000:
-        return f"{amount // 1000} Thousand"
-    elif amount < 1000000:
-        thousands = amount // 1000
-        if thousands % 100 == 0:
-            return f"{thousands // 100} Hundred Thousand"
-        else:
-            return f"{thousands} Thousand"
-    else:
-        # Handle millions
-        millions = amount // 1000000
-        remainder = amount % 1000000
-        if remainder == 0:
-            return f"{millions} Million"
-        elif remainder < 1000:
-            return f"{millions} Million {remainder}"
-        else:
-            thousands = remainder // 1000
-            if thousands == 0:
-                return f"{millions} Million"
-            else:
-                return f"{millions} Million {thousands} Thousand"
+    parts = []
+    for value, name in _SCALES:
+        quotient, amount = divmod(amount, value)
+        if quotient:
+            parts.append(f"{quotient} {name}".strip())
+    return " ".join(parts) or "Zero"
+
+def _fmt_date(d):
+    """Format a date the way the agreement spells it out, e.g. 01 March 2025"""
+    return d.strftime("%d %B %Y")
+
+# Widget options
+_CONF_INFO_OPTIONS = (
+    "Technical information and trade secrets",
+    "Business strategies and plans",
+    "Customer lists and client information",
+    "Financial information and pricing",
+    "Software source code and algorithms",
+    "Marketing strategies and campaigns",
+    "Supplier and vendor information",
+    "Research and development data",
+    "Personnel information (subject to POPIA)",
+    "Manufacturing processes and methods"
+)
+_CONF_INFO_DEFAULT = (_CONF_INFO_OPTIONS[0], _CONF_INFO_OPTIONS[1])
+
+_EXPORT_FORMATS = tuple(filter(None, (
+    "Text (.txt)",
+    "PDF (.pdf)" if PDF_AVAILABLE else None,
+    "Word (.docx)" if DOCX_AVAILABLE else None
+)))
 
 def main():
     st.set_page_config(
@@ -136,114 +129,105 @@ def main():
     st.sidebar.header("Contract Configuration")
     contract_type = st.sidebar.selectbox(
         "Select NDA Type:",
-        ["Employee NDA", "Contractor NDA", "Mutual NDA"]
+        _CONTRACT_TYPES
     )
+    # Decides which party fields the form shows, so it cannot live inside the form
+    if contract_type == "Mutual NDA":
+        other_party_type = st.sidebar.selectbox("Other Party Type:", ["Company", "Individual"])
     
     # Export format selection
     st.sidebar.header("Export Options")
-    export_formats = ["Text (.txt)"]
-    if PDF_AVAILABLE:
-        export_formats.append("PDF (.pdf)")
-    if DOCX_AVAILABLE:
-        export_formats.append("Word (.docx)")
+    export_format = st.sidebar.selectbox("Download Format:", _EXPORT_FORMATS)
     
-    export_format = st.sidebar.selectbox("Download Format:", export_formats)
-    
-    # Main form
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.header("Party Details")
+    # Main form; widgets inside it only rerun the script on submit
+    with st.form("nda_form"):
+        col1, col2 = st.columns(2)
         
-        # Company details
-        st.subheader("🏢 Disclosing Party (Company)")
-        company_name = st.text_input("Company Name*", placeholder="ABC (Pty) Ltd")
-        company_reg = st.text_input("Registration Number*", placeholder="2023/123456/07")
-        company_address = st.text_area("Registered Address*", placeholder="123 Main Street, Johannesburg, 2001")
-        company_rep = st.text_input("Authorized Representative*", placeholder="John Smith")
-        company_position = st.text_input("Representative Position*", placeholder="Managing Director")
-        
-        # Individual/Other party details
-        st.subheader("👤 Receiving Party")
-        if contract_type == "Mutual NDA":
-            other_party_type = st.selectbox("Other Party Type:", ["Company", "Individual"])
-            if other_party_type == "Company":
-                other_name = st.text_input("Company Name*", placeholder="XYZ (Pty) Ltd")
-                other_reg = st.text_input("Registration Number*", placeholder="2023/654321/07")
-                other_address = st.text_area("Registered Address*", placeholder="456 Business Ave, Cape Town, 8001")
+        with col1:
+            st.header("Party Details")
+            
+            # Company details
+            st.subheader("🏢 Disclosing Party (Company)")
+            company_name = st.text_input("Company Name*", placeholder="ABC (Pty) Ltd")
+            company_reg = st.text_input("Registration Number*", placeholder="2023/123456/07")
+            company_address = st.text_area("Registered Address*", placeholder="123 Main Street, Johannesburg, 2001")
+            company_rep = st.text_input("Authorized Representative*", placeholder="John Smith")
+            company_position = st.text_input("Representative Position*", placeholder="Managing Director")
+            
+            # Individual/Other party details
+            st.subheader("👤 Receiving Party")
+            if contract_type == "Mutual NDA":
+                if other_party_type == "Company":
+                    other_name = st.text_input("Company Name*", placeholder="XYZ (Pty) Ltd")
+                    other_reg = st.text_input("Registration Number*", placeholder="2023/654321/07")
+                    other_address = st.text_area("Registered Address*", placeholder="456 Business Ave, Cape Town, 8001")
+                else:
+                    other_name = st.text_input("Full Name*", placeholder="Jane Doe")
+                    other_id = st.text_input("ID Number*", placeholder="8501015800083")
+                    other_address = st.text_area("Residential Address*", placeholder="789 Residential St, Durban, 4001")
             else:
                 other_name = st.text_input("Full Name*", placeholder="Jane Doe")
                 other_id = st.text_input("ID Number*", placeholder="8501015800083")
                 other_address = st.text_area("Residential Address*", placeholder="789 Residential St, Durban, 4001")
-        else:
-            other_name = st.text_input("Full Name*", placeholder="Jane Doe")
-            other_id = st.text_input("ID Number*", placeholder="8501015800083")
-            other_address = st.text_area("Residential Address*", placeholder="789 Residential St, Durban, 4001")
-            if contract_type == "Employee NDA":
-                job_title = st.text_input("Job Title/Position*", placeholder="Software Developer")
-                employment_date = st.date_input("Employment Start Date*", datetime.now())
-    
-    with col2:
-        st.header("NDA Terms")
-        
-        # Confidential information definition
-        st.subheader("🔒 Confidential Information")
-        confidential_info = st.multiselect(
-            "Select types of confidential information:",
-            [
-                "Technical information and trade secrets",
-                "Business strategies and plans",
-                "Customer lists and client information",
-                "Financial information and pricing",
-                "Software source code and algorithms",
-                "Marketing strategies and campaigns",
-                "Supplier and vendor information",
-                "Research and development data",
-                "Personnel information (subject to POPIA)",
-                "Manufacturing processes and methods"
-            ],
-            default=["Technical information and trade secrets", "Business strategies and plans"]
-        )
-        
-        additional_info = st.text_area(
-            "Additional confidential information (optional):",
-            placeholder="Specify any additional confidential information..."
-        )
-        
-        # Duration and scope
-        st.subheader("⏰ Duration & Scope")
-        duration_years = st.selectbox("Confidentiality Duration (years):", [1, 2, 3, 5, 10, "Indefinite"])
+                if contract_type == "Employee NDA":
+                    job_title = st.text_input("Job Title/Position*", placeholder="Software Developer")
+                    employment_date = st.date_input("Employment Start Date*", datetime.now())
         
-        if contract_type != "Mutual NDA":
-            geographic_scope = st.selectbox(
-                "Geographic Scope:",
-                ["South Africa only", "Africa", "Global"]
+        with col2:
+            st.header("NDA Terms")
+            
+            # Confidential information definition
+            st.subheader("🔒 Confidential Information")
+            confidential_info = st.multiselect(
+                "Select types of confidential information:",
+                _CONF_INFO_OPTIONS,
+                default=_CONF_INFO_DEFAULT
             )
             
-            post_employment = st.checkbox(
-                "Extends beyond employment termination",
-                value=True
+            additional_info = st.text_area(
+                "Additional confidential information (optional):",
+                placeholder="Specify any additional confidential information..."
             )
-        
-        # Remedies
-        st.subheader("⚖️ Remedies for Breach")
-        liquidated_damages = st.checkbox("Include liquidated damages clause")
-        if liquidated_damages:
-            damages_amount = st.number_input("Liquidated Damages Amount (ZAR):", min_value=0, value=50000, step=5000)
-        
-        interdict_relief = st.checkbox("Include interdict/injunctive relief", value=True)
-        
-        # POPIA compliance
-        st.subheader("🛡️ POPIA Compliance")
-        involves_personal_data = st.checkbox("Involves processing of personal information")
-        if involves_personal_data:
+            
+            # Duration and scope
+            st.subheader("⏰ Duration & Scope")
+            duration_years = st.selectbox("Confidentiality Duration (years):", [1, 2, 3, 5, 10, "Indefinite"])
+            
+            if contract_type != "Mutual NDA":
+                geographic_scope = st.selectbox(
+                    "Geographic Scope:",
+                    ["South Africa only", "Africa", "Global"]
+                )
+                
+                post_employment = st.checkbox(
+                    "Extends beyond employment termination",
+                    value=True
+                )
+            
+            # Remedies
+            st.subheader("⚖️ Remedies for Breach")
+            liquidated_damages = st.checkbox("Include liquidated damages clause")
+            damages_amount = st.number_input(
+                "Liquidated Damages Amount (ZAR):",
+                min_value=0, value=50000, step=5000,
+                help="Only used when the liquidated damages clause is included"
+            )
+            
+            interdict_relief = st.checkbox("Include interdict/injunctive relief", value=True)
+            
+            # POPIA compliance
+            st.subheader("🛡️ POPIA Compliance")
+            involves_personal_data = st.checkbox("Involves processing of personal information")
             data_types = st.multiselect(
                 "Types of personal information:",
-                ["Employee personal data", "Customer personal data", "Supplier personal data", "Other personal data"]
+                ["Employee personal data", "Customer personal data", "Supplier personal data", "Other personal data"],
+                help="Only used when personal information is processed"
             )
+        
+        # Generate contract button
+        submitted = st.form_submit_button("Generate NDA Contract", type="primary")
     
-    # Generate contract button
-    if st.button("Generate NDA Contract", type="primary"):
+    if submitted:
         if validate_inputs(company_name, company_reg, company_address, other_name):
             contract_data = {
                 'contract_type': contract_type,
@@ -271,92 +255,282 @@ def main():
             
             st.success("✅ NDA Contract Generated Successfully!")
             
-            # Generate and display based on format
+            # Read the clock once for the agreement date and the file names
+            now = datetime.now()
+            current_date = _fmt_date(now.date())
+            base_name = f"SA_NDA_{company_name.replace(' ', '_')}_{now.strftime('%Y%m%d')}"
+            
+            # Generate and display based on format; PDF and Word for identical inputs on
+            # the same day are served from the output caches, text is cheaper to rebuild
             if export_format == "Text (.txt)":
-                contract_text = generate_nda_text(contract_data)
+                contract_text = generate_nda_text(contract_data, current_date)
                 st.subheader("📄 Generated NDA Contract")
                 st.text_area("Contract Text:", value=contract_text, height=400)
                 
                 st.download_button(
                     label="📥 Download as Text",
                     data=contract_text,
-                    file_name=f"SA_NDA_{company_name.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.txt",
+                    file_name=f"{base_name}.txt",
                     mime="text/plain"
                 )
             
             elif export_format == "PDF (.pdf)" and PDF_AVAILABLE:
-                pdf_buffer = generate_nda_pdf(contract_data)
+                pdf_bytes = _cached_pdf(_freeze(contract_data), current_date)
                 st.subheader("📄 Generated NDA Contract (PDF Preview)")
                 st.success("PDF generated successfully! Use the download button below.")
                 
                 st.download_button(
                     label="📥 Download as PDF",
-                    data=pdf_buffer.getvalue(),
-                    file_name=f"SA_NDA_{company_name.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.pdf",
+                    data=pdf_bytes,
+                    file_name=f"{base_name}.pdf",
                     mime="application/pdf"
                 )
             
             elif export_format == "Word (.docx)" and DOCX_AVAILABLE:
-                docx_buffer = generate_nda_docx(contract_data)
+                docx_bytes = _cached_docx(_freeze(contract_data), current_date)
                 st.subheader("📄 Generated NDA Contract (Word Preview)")
                 st.success("Word document generated successfully! Use the download button below.")
                 
                 st.download_button(
                     label="📥 Download as Word Document",
-                    data=docx_buffer.getvalue(),
-                    file_name=f"SA_NDA_{company_name.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.docx",
+                    data=docx_bytes,
+                    file_name=f"{base_name}.docx",
                     mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document"
                 )
         else:
             st.error("❌ Please fill in all required fields marked with *")
 
 def validate_inputs(company_name, company_reg, company_address, other_name):
-    return all([company_name, company_reg, company_address, other_name])
+    # Short-circuits on the first missing field; whitespace-only input counts as missing
+    return bool(
+        company_name and company_name.strip()
+        and company_reg and company_reg.strip()
+        and company_address and company_address.strip()
+        and other_name and other_name.strip()
+    )
 
-def generate_nda_pdf(contract_data):
-    """Generate PDF version of the NDA with proper formatting"""
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=A4, 
-                           rightMargin=72, leftMargin=72,
-                           topMargin=72, bottomMargin=18)
+# Field order of the frozen cache key; must list every key main() puts in contract_data
+_CONTRACT_FIELDS = (
+    'contract_type', 'company_name', 'company_reg', 'company_address', 'company_rep', 'company_position',
+    'other_name', 'other_id', 'other_address', 'confidential_info', 'additional_info', 'duration_years',
+    'geographic_scope', 'liquidated_damages', 'damages_amount', 'interdict_relief', 'involves_personal_data',
+    'data_types', 'job_title', 'employment_date', 'post_employment'
+)
+
+def _freeze(contract_data):
+    """Turn contract_data into a hashable tuple of its values so it can key the output caches"""
+    values = []
+    for field in _CONTRACT_FIELDS:
+        value = contract_data[field]
+        values.append(tuple(value) if isinstance(value, list) else value)
+    return tuple(values)
+
+def _thaw(frozen_data):
+    """Rebuild the contract_data dict from its frozen form"""
+    return {field: list(value) if isinstance(value, tuple) else value for field, value in zip(_CONTRACT_FIELDS, frozen_data)}
+
+# current_date is part of the cache key, so a cached NDA never carries yesterday's date
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_pdf(frozen_data, current_date):
+    return generate_nda_pdf(_thaw(frozen_data), current_date).getvalue()
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_docx(frozen_data, current_date):
+    return generate_nda_docx(_thaw(frozen_data), current_date).getvalue()
+
+_WITNESS_NODES = (
+    ('P', "WITNESS:", 'body'),
+    ('SPACER', '', '30'),
+    ('P', "_________________________________", 'body'),
+    ('P', "Full Name:", 'body'),
+    ('P', "Date:", 'body'),
+    ('SPACER', '', '20')
+)
+
+# Signature section; each None is filled with the next party-specific line (skipped when that line is None)
+_SIGNATURE_NODES = (
+    ('SPACER', '', '20'),
+    ('P', "IN WITNESS WHEREOF, the Parties have executed this Agreement on the date first written above.", 'body'),
+    ('SPACER', '', '20'),
+    ('P', "SIGNED AT _________________________ ON _________________________", 'body'),
+    ('SPACER', '', '20'),
+    
+    # Company signature
+    ('P', "THE COMPANY:", 'body'),
+    ('SPACER', '', '30'),
+    ('P', "_________________________________", 'body'),
+    None,  # Representative
+    None,  # Position
+    None,  # Company name
+    ('SPACER', '', '20'),
+    *_WITNESS_NODES,
+    
+    # Recipient signature
+    ('P', "THE RECIPIENT:", 'body'),
+    ('SPACER', '', '30'),
+    ('P', "_________________________________", 'body'),
+    None,  # Recipient name
+    None,  # ID Number, if any
+    ('SPACER', '', '20'),
+    *_WITNESS_NODES,
+    
+    # Legal disclaimer
+    ('PAGEBREAK', '', None),
+    ('P', "<b>LEGAL DISCLAIMER:</b> This NDA has been generated to comply with South African law as of 2024. However, legal requirements may change, and specific circumstances may require additional provisions. It is recommended to have this agreement reviewed by a qualified South African attorney before execution.", 'body')
+)
+
+def build_nda_nodes(contract_data, current_date=None):
+    """Describe the NDA as a flat list of (kind, text, arg) nodes shared by the PDF and Word renderers
+    
+    Node text is escaped markup where only <b>...</b> is allowed. arg is the paragraph style for P and
+    LIST nodes, the height for SPACER nodes and the contract type for STATIC nodes. LIST node text is
+    a tuple with the markup of each item.
+    """
+    if current_date is None:
+        current_date = _fmt_date(datetime.now().date())
+    
+    # Look every field up once; values are escaped here so the node text is markup-safe
+    contract_type = contract_data['contract_type']
+    company_name = contract_data['company_name']
+    company_reg = escape(contract_data['company_reg'])
+    company_address = escape(contract_data['company_address'])
+    company_rep = escape(contract_data['company_rep'])
+    company_position = escape(contract_data['company_position'])
+    other_name = contract_data['other_name']
+    other_id = contract_data['other_id']
+    other_address = escape(contract_data['other_address'])
+    confidential_info = contract_data['confidential_info']
+    additional_info = contract_data['additional_info']
+    
+    # Optional phrases of the recipient paragraph
+    id_frag = f", ID Number: {escape(other_id)}" if other_id else ""
+    emp_frag = ""
+    if contract_type == 'Employee NDA':
+        emp_frag = f", employed as {escape(contract_data['job_title'])} from {_fmt_date(contract_data['employment_date'])}"
+    
+    nodes = [
+        ('STATIC', 'title', contract_type),
+        ('P', f"THIS AGREEMENT is made on {current_date}", 'body'),
+        ('SPACER', '', '12'),
+        
+        # Parties
+        ('H2', "BETWEEN:", None),
+        ('P', f"(1) <b>{escape(company_name.upper())}</b> (Registration Number: {company_reg}), a company duly incorporated in accordance with the laws of the Republic of South Africa, with its registered address at {company_address} (hereinafter referred to as \"the Company\" or \"Disclosing Party\"), represented herein by {company_rep}, {company_position}, who warrants that he/she has the necessary authority to bind the Company; and", 'body'),
+        ('SPACER', '', '8'),
+        ('P', f"(2) <b>{escape(other_name.upper())}</b>{id_frag}, with address at {other_address} (hereinafter referred to as \"the Recipient\" or \"Receiving Party\"){emp_frag}.", 'body'),
+        ('SPACER', '', '12'),
+        ('STATIC', 'recitals', contract_type),
+        
+        # Section 1: Definition of Confidential Information
+        ('H1', "1. DEFINITION OF CONFIDENTIAL INFORMATION", None),
+        ('P', "1.1 \"Confidential Information\" shall mean all non-public, proprietary, or confidential information disclosed by the Company to the Recipient, whether orally, in writing, electronically, or by observation, including but not limited to:", 'body')
+    ]
+    
+    items = list(confidential_info)
+    if additional_info:
+        items.append(additional_info)
+    if items:
+        nodes.append(('LIST', tuple(f"{i}. {escape(item)};" for i, item in enumerate(items, 1)), 'number'))
+    
+    nodes.append(('STATIC', 'exceptions', contract_type))
+    
+    # Remaining clauses
+    # TODO: Implement additional clauses (e.g., obligations, compliance, remedies, etc.)
+    nodes.extend([
+        ('H1', "2. OBLIGATIONS OF THE RECIPIENT", None),
+        ('P', "2.1 The Recipient shall not disclose, publish, or otherwise reveal any of the Confidential Information received from the Company to any other party whatsoever except with the specific prior written authorization of the Company.", 'body'),
+        ('H1', "3. CONSTITUTIONAL AND STATUTORY COMPLIANCE", None),
+        ('P', "3.1 This Agreement complies with the Protection of Personal Information Act 4 of 2013 (POPIA) and other relevant South African legislation.", 'body')
+    ])
     
-    # Create custom styles
-    styles = getSampleStyleSheet()
+    # Signature section
+    party_lines = iter((
+        company_rep,
+        company_position,
+        escape(company_name),
+        escape(other_name),
+        f"ID Number: {escape(other_id)}" if other_id else None
+    ))
+    for node in _SIGNATURE_NODES:
+        if node is not None:
+            nodes.append(node)
+        else:
+            line = next(party_lines)
+            if line is not None:
+                nodes.append(('P', line, 'body'))
+    
+    return nodes
+
+def _static_nodes(contract_type, section):
+    """Return the nodes of a section that only depends on the contract type"""
+    if section == 'title':
+        return [
+            ('TITLE', "NON-DISCLOSURE AGREEMENT", None),
+            ('SUBTITLE', "(Compliant with South African Law)", None),
+            ('SPACER', '', '20')
+        ]
+    
+    if section == 'recitals':
+        nodes = [
+            ('P', "(The Company and the Recipient may be referred to individually as a \"Party\" and collectively as the \"Parties\")", 'body'),
+            ('SPACER', '', '20'),
+            ('H1', "RECITALS", None)
+        ]
+        for recital in _RECITALS_BY_TYPE[contract_type]:
+            nodes.append(('P', recital, 'body'))
+            nodes.append(('SPACER', '', '8'))
+        nodes.append(('P', "NOW THEREFORE, the Parties agree as follows:", 'body'))
+        nodes.append(('SPACER', '', '20'))
+        return nodes
+    
+    if section == 'exceptions':
+        return [
+            ('P', "1.2 Confidential Information shall not include information that:", 'body'),
+            ('LIST', tuple(f"{label} {escape(exception)}" for label, exception in zip(_ALPHA_LABELS, _EXCEPTIONS)), 'bullet')
+        ]
+    
+    raise ValueError(f"Unknown static section: {section}")
+
+@st.cache_resource
+def _get_pdf_styles():
+    """Build the PDF paragraph styles once and share them across reruns"""
+    rl = _reportlab()
+    styles = rl.getSampleStyleSheet()
     
     # Custom title style
-    title_style = ParagraphStyle(
+    title_style = rl.ParagraphStyle(
         'CustomTitle',
         parent=styles['Heading1'],
         fontSize=18,
         spaceAfter=30,
         alignment=1,  # Center alignment
-        textColor=colors.black,
+        textColor=rl.colors.black,
         fontName='Helvetica-Bold'
     )
     
     # Custom heading styles
-    h1_style = ParagraphStyle(
+    h1_style = rl.ParagraphStyle(
         'CustomH1',
         parent=styles['Heading1'],
         fontSize=14,
         spaceAfter=12,
         spaceBefore=20,
-        textColor=colors.black,
+        textColor=rl.colors.black,
         fontName='Helvetica-Bold'
     )
     
-    h2_style = ParagraphStyle(
+    h2_style = rl.ParagraphStyle(
         'CustomH2',
         parent=styles['Heading2'],
         fontSize=12,
         spaceAfter=8,
         spaceBefore=15,
-        textColor=colors.black,
+        textColor=rl.colors.black,
         fontName='Helvetica-Bold'
     )
     
     # Body text style
-    body_style = ParagraphStyle(
+    body_style = rl.ParagraphStyle(
         'CustomBody',
         parent=styles['Normal'],
         fontSize=11,
@@ -365,292 +539,153 @@ def generate_nda_pdf(contract_data):
         fontName='Helvetica'
     )
     
-    # Build the document
+    return {
+        'normal': styles['Normal'],
+        'title': title_style,
+        'h1': h1_style,
+        'h2': h2_style,
+        'body': body_style
+    }
+
+# PDF renderer: each node kind appends ReportLab flowables to the story
+_PDF_DISPATCH = {
+    'TITLE': lambda story, rl, styles, text, arg: story.append(rl.Paragraph(text, styles['title'])),
+    'SUBTITLE': lambda story, rl, styles, text, arg: story.append(rl.Paragraph(text, styles['normal'])),
+    'H1': lambda story, rl, styles, text, arg: story.append(rl.Paragraph(text, styles['h1'])),
+    'H2': lambda story, rl, styles, text, arg: story.append(rl.Paragraph(text, styles['h2'])),
+    # P nodes are built by _render_pdf_story so repeated paragraphs can share their parsed fragments
+    # One Paragraph for the whole list instead of one per item
+    'LIST': lambda story, rl, styles, text, arg: story.append(rl.Paragraph("<br/>".join(f"&nbsp;&nbsp;&nbsp;&nbsp;{item}" for item in text), styles['body'])),
+    'SPACER': lambda story, rl, styles, text, arg: story.append(rl.Spacer(1, int(arg))),
+    'PAGEBREAK': lambda story, rl, styles, text, arg: story.append(rl.PageBreak()),
+    'STATIC': lambda story, rl, styles, text, arg: story.extend(
+        _static_pdf_flowables(arg, text) if text in _PDF_CACHED_SECTIONS else _render_pdf_story(_static_nodes(arg, text))
+    )
+}
+
+# Static sections whose parsing outweighs a cache hit; smaller ones are cheaper to rebuild
+_PDF_CACHED_SECTIONS = ('recitals', 'exceptions')
+
+def _render_pdf_story(nodes):
+    """Turn document nodes into a list of ReportLab flowables"""
+    rl = _reportlab()
+    styles = _get_pdf_styles()
     story = []
-    current_date = datetime.now().strftime("%d %B %Y")
-    
-    # Title
-    story.append(Paragraph("NON-DISCLOSURE AGREEMENT", title_style))
-    story.append(Paragraph("(Compliant with South African Law)", styles['Normal']))
-    story.append(Spacer(1, 20))
-    
-    # Agreement details
-    story.append(Paragraph(f"THIS AGREEMENT is made on {current_date}", body_style))
-    story.append(Spacer(1, 12))
-    
-    # Parties
-    story.append(Paragraph("BETWEEN:", h2_style))
-    
-    # Company details
-    company_text = f"""(1) <b>{contract_data['company_name'].upper()}</b> (Registration Number: {contract_data['company_reg']}), 
-    a company duly incorporated in accordance with the laws of the Republic of South Africa, with its registered address at 
-    {contract_data['company_address']} (hereinafter referred to as "the Company" or "Disclosing Party"), represented herein by 
-    {contract_data['company_rep']}, {contract_data['company_position']}, who warrants that he/she has the necessary authority to bind the Company; and"""
-    
-    story.append(Paragraph(company_text, body_style))
-    story.append(Spacer(1, 8))
-    
-    # Other party details
-    other_party_text = f"""(2) <b>{contract_data['other_name'].upper()}</b>{f", ID Number: {contract_data['other_id']}" if contract_data['other_id'] else ""}, 
-    with address at {contract_data['other_address']} (hereinafter referred to as "the Recipient" or "Receiving Party")
-    {f", employed as {contract_data['job_title']} from {contract_data['employment_date'].strftime('%d %B %Y')}" if contract_data['contract_type'] == 'Employee NDA' else ""}."""
-    
-    story.append(Paragraph(other_party_text, body_style))
-    story.append(Spacer(1, 12))
-    
-    story.append(Paragraph("(The Company and the Recipient may be referred to individually as a \"Party\" and collectively as the \"Parties\")", body_style))
-    story.append(Spacer(1, 20))
-    
-    # RECITALS
-    story.append(Paragraph("RECITALS", h1_style))
-    
-    recitals = [
-        "WHEREAS, the Company possesses certain confidential and proprietary information, trade secrets, and intellectual property that constitute valuable business assets;",
-        f"WHEREAS, the Recipient {'is employed by' if contract_data['contract_type'] == 'Employee NDA' else 'will be engaged by'} the Company and will have access to such confidential information in the course of {'employment' if contract_data['contract_type'] == 'Employee NDA' else 'the engagement'};",
-        "WHEREAS, the Parties wish to protect the confidentiality of such information in accordance with the laws of the Republic of South Africa, including but not limited to the Constitution of South Africa (1996), Labour Relations Act 66 of 1995, Basic Conditions of Employment Act 75 of 1997, Protection of Personal Information Act 4 of 2013, Competition Act 89 of 1998, and Protected Disclosures Act 26 of 2000;"
-    ]
-    
-    for recital in recitals:
-        story.append(Paragraph(recital, body_style))
-        story.append(Spacer(1, 8))
-    
-    story.append(Paragraph("NOW THEREFORE, the Parties agree as follows:", body_style))
-    story.append(Spacer(1, 20))
-    
-    # Main clauses
-    add_main_clauses_to_story(story, contract_data, h1_style, h2_style, body_style)
-    
-    # Signature section
-    add_signature_section_to_story(story, contract_data, h1_style, body_style)
+    # Repeated paragraphs (witness blocks, signature lines) skip ReportLab's markup parser after their first occurrence
+    parsed = {}
+    # Bound once; the loop runs for every node of the document
+    paragraph, append, dispatch = rl.Paragraph, story.append, _PDF_DISPATCH
+    for node in nodes:
+        kind, text, arg = node
+        if kind == 'P':
+            para = paragraph(text, styles[arg], frags=parsed.get(node))
+            parsed.setdefault(node, para.frags)
+            append(para)
+        else:
+            dispatch[kind](story, rl, styles, text, arg)
+    return story
+
+@st.cache_data(show_spinner=False)
+def _static_pdf_flowables(contract_type, section):
+    """Build the PDF flowables of a section that only depends on the contract type"""
+    return _render_pdf_story(_static_nodes(contract_type, section))
+
+def generate_nda_pdf(contract_data, current_date=None):
+    """Generate PDF version of the NDA with proper formatting"""
+    rl = _reportlab()
+    buffer = BytesIO()
+    doc = rl.SimpleDocTemplate(buffer, pagesize=rl.A4, 
+                               rightMargin=72, leftMargin=72,
+                               topMargin=72, bottomMargin=18)
     
     # Build PDF
-    doc.build(story)
+    doc.build(_render_pdf_story(build_nda_nodes(contract_data, current_date)))
     buffer.seek(0)
     return buffer
 
-def generate_nda_docx(contract_data):
+# Word renderer: each node kind becomes WordprocessingML paragraphs, parsed in one go at the end
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+_DOCX_LIST_STYLES = {
+    'number': 'ListNumber',
+    'bullet': 'ListBullet'
+}
+
+# Same markup python-docx writes for a newline in run text
+_DOCX_LINE_BREAK = '</w:t><w:br/><w:t xml:space="preserve">'
+
+def _docx_p(text, style_id=None, center=False):
+    """Return a <w:p> for node markup, turning <b>...</b> into bold runs"""
+    ppr = ""
+    if style_id or center:
+        ppr = "<w:pPr>"
+        if style_id:
+            ppr += f'<w:pStyle w:val="{style_id}"/>'
+        if center:
+            ppr += '<w:jc w:val="center"/>'
+        ppr += "</w:pPr>"
+    
+    runs = []
+    bold = False
+    for chunk in re.split(r"(</?b>)", text):
+        if chunk in ("<b>", "</b>"):
+            bold = chunk == "<b>"
+        elif chunk:
+            rpr = "<w:rPr><w:b/></w:rPr>" if bold else ""
+            chunk = chunk.replace("\n", _DOCX_LINE_BREAK)
+            runs.append(f'<w:r>{rpr}<w:t xml:space="preserve">{chunk}</w:t></w:r>')
+    
+    return f"<w:p>{ppr}{''.join(runs)}</w:p>"
+
+def _fast_p(text):
+    """Return a <w:p> holding a single plain run, for paragraphs without markup or style"""
+    text = text.replace("\n", _DOCX_LINE_BREAK)
+    return f'<w:p><w:r><w:t xml:space="preserve">{text}</w:t></w:r></w:p>'
+
+_DOCX_DISPATCH = {
+    'TITLE': lambda text, arg: _docx_p(text, 'Title', center=True),
+    'SUBTITLE': lambda text, arg: _docx_p(text, center=True),
+    'H1': lambda text, arg: _docx_p(text, 'Heading1'),
+    'H2': lambda text, arg: _docx_p(text, 'Heading2'),
+    'P': lambda text, arg: _docx_p(text) if "<b>" in text else _fast_p(text),
+    'LIST': lambda text, arg: "".join(_docx_p(item, _DOCX_LIST_STYLES[arg]) for item in text),
+    'SPACER': lambda text, arg: "<w:p/>",
+    'PAGEBREAK': lambda text, arg: '<w:p><w:r><w:br w:type="page"/></w:r></w:p>',
+    'STATIC': lambda text, arg: _render_docx_xml(_static_nodes(arg, text))
+}
+
+def _render_docx_xml(nodes):
+    """Turn document nodes into a WordprocessingML body fragment"""
+    parts = []
+    # Repeated nodes (witness blocks, signature lines, blank lines) reuse the XML of their first occurrence
+    rendered = {}
+    for node in nodes:
+        xml = rendered.get(node)
+        if xml is None:
+            kind, text, arg = node
+            xml = rendered[node] = _DOCX_DISPATCH[kind](text, arg)
+        parts.append(xml)
+    return "".join(parts)
+
+def generate_nda_docx(contract_data, current_date=None):
     """Generate Word document version of the NDA"""
+    python_docx = _python_docx()
     buffer = BytesIO()
-    doc = Document()
-    
-    # Set up styles
-    title_style = doc.styles['Title']
-    heading1_style = doc.styles['Heading 1']
-    heading2_style = doc.styles['Heading 2']
-    normal_style = doc.styles['Normal']
-    
-    # Title
-    title = doc.add_paragraph("NON-DISCLOSURE AGREEMENT", style=title_style)
-    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    
-    subtitle = doc.add_paragraph("(Compliant with South African Law)")
-    subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    
-    doc.add_paragraph()  # Space
-    
-    current_date = datetime.now().strftime("%d %B %Y")
-    doc.add_paragraph(f"THIS AGREEMENT is made on {current_date}")
-    doc.add_paragraph()
-    
-    # Parties section
-    doc.add_heading("BETWEEN:", level=2)
-    
-    # Company details
-    company_para = doc.add_paragraph()
-    company_para.add_run(f"(1) {contract_data['company_name'].upper()}").bold = True
-    company_para.add_run(f" (Registration Number: {contract_data['company_reg']}), a company duly incorporated in accordance with the laws of the Republic of South Africa, with its registered address at {contract_data['company_address']} (hereinafter referred to as \"the Company\" or \"Disclosing Party\"), represented herein by {contract_data['company_rep']}, {contract_data['company_position']}, who warrants that he/she has the necessary authority to bind the Company; and")
-    
-    # Other party details
-    other_para = doc.add_paragraph()
-    other_para.add_run(f"(2) {contract_data['other_name'].upper()}").bold = True
-    other_para.add_run(f"{f', ID Number: {contract_data['other_id']}' if contract_data['other_id'] else ''}, with address at {contract_data['other_address']} (hereinafter referred to as \"the Recipient\" or \"Receiving Party\"){f', employed as {contract_data['job_title']} from {contract_data['employment_date'].strftime('%d %B %Y')}' if contract_data['contract_type'] == 'Employee NDA' else ''}.")
-    
-    doc.add_paragraph("(The Company and the Recipient may be referred to individually as a \"Party\" and collectively as the \"Parties\")")
-    doc.add_paragraph()
-    
-    # RECITALS
-    doc.add_heading("RECITALS", level=1)
-    
-    recitals = [
-        "WHEREAS, the Company possesses certain confidential and proprietary information, trade secrets, and intellectual property that constitute valuable business assets;",
-        f"WHEREAS, the Recipient {'is employed by' if contract_data['contract_type'] == 'Employee NDA' else 'will be engaged by'} the Company and will have access to such confidential information in the course of {'employment' if contract_data['contract_type'] == 'Employee NDA' else 'the engagement'};",
-        "WHEREAS, the Parties wish to protect the confidentiality of such information in accordance with the laws of the Republic of South Africa, including but not limited to the Constitution of South Africa (1996), Labour Relations Act 66 of 1995, Basic Conditions of Employment Act 75 of 1997, Protection of Personal Information Act 4 of 2013, Competition Act 89 of 1998, and Protected Disclosures Act 26 of 2000;"
-    ]
-    
-    for recital in recitals:
-        doc.add_paragraph(recital)
-    
-    doc.add_paragraph("NOW THEREFORE, the Parties agree as follows:")
-    doc.add_paragraph()
-    
-    # Add main content
-    add_main_clauses_to_docx(doc, contract_data)
+    doc = python_docx.Document()
     
-    # Add signature section
-    add_signature_section_to_docx(doc, contract_data)
+    # Parse the whole body once and keep it ahead of the trailing section properties
+    body = python_docx.parse_xml(f'<w:body xmlns:w="{_W_NS}">{_render_docx_xml(build_nda_nodes(contract_data, current_date))}</w:body>')
+    sect_pr = doc.element.body.sectPr
+    for element in list(body):
+        sect_pr.addprevious(element)
     
     doc.save(buffer)
     buffer.seek(0)
     return buffer
 
-def add_main_clauses_to_story(story, contract_data, h1_style, h2_style, body_style):
-    """Add main contract clauses to PDF story"""
-    # Section 1: Definition of Confidential Information
-    story.append(Paragraph("1. DEFINITION OF CONFIDENTIAL INFORMATION", h1_style))
-    
-    story.append(Paragraph("1.1 \"Confidential Information\" shall mean all non-public, proprietary, or confidential information disclosed by the Company to the Recipient, whether orally, in writing, electronically, or by observation, including but not limited to:", body_style))
-    
-    for i, item in enumerate(contract_data['confidential_info'], 1):
-        story.append(Paragraph(f"&nbsp;&nbsp;&nbsp;&nbsp;{i}. {item};", body_style))
-    
-    if contract_data['additional_info']:
-        story.append(Paragraph(f"&nbsp;&nbsp;&nbsp;&nbsp;{len(contract_data['confidential_info']) + 1}. {contract_data['additional_info']};", body_style))
-    
-    # Exceptions
-    story.append(Paragraph("1.2 Confidential Information shall not include information that:", body_style))
-    exceptions = [
-        "Is or becomes publicly available through no breach of this Agreement by the Recipient;",
-        "Was rightfully known by the Recipient before disclosure by the Company;",
-        "Is rightfully received by the Recipient from a third party without breach of any confidentiality obligation;",
-        "Is independently developed by the Recipient without use of or reference to the Confidential Information;",
-        "Is required to be disclosed by law, regulation, or court order, provided that the Recipient gives the Company reasonable advance notice of such requirement."
-    ]
-    
-    for i, exception in enumerate(exceptions, ord('a')):
-        story.append(Paragraph(f"&nbsp;&nbsp;&nbsp;&nbsp;({chr(i)}) {exception}", body_style))
-    
-    # Continue with other sections
-    add_remaining_clauses_to_story(story, contract_data, h1_style, h2_style, body_style)
-
-def add_main_clauses_to_docx(doc, contract_data):
-    """Add main contract clauses to Word document"""
-    # Section 1: Definition of Confidential Information
-    doc.add_heading("1. DEFINITION OF CONFIDENTIAL INFORMATION", level=1)
-    
-    doc.add_paragraph("1.1 \"Confidential Information\" shall mean all non-public, proprietary, or confidential information disclosed by the Company to the Recipient, whether orally, in writing, electronically, or by observation, including but not limited to:")
-    
-    for i, item in enumerate(contract_data['confidential_info'], 1):
-        doc.add_paragraph(f"{i}. {item};", style='List Number')
-    
-    if contract_data['additional_info']:
-        doc.add_paragraph(f"{len(contract_data['confidential_info']) + 1}. {contract_data['additional_info']};", style='List Number')
-    
-    # Exceptions
-    doc.add_paragraph("1.2 Confidential Information shall not include information that:")
-    exceptions = [
-        "Is or becomes publicly available through no breach of this Agreement by the Recipient;",
-        "Was rightfully known by the Recipient before disclosure by the Company;",
-        "Is rightfully received by the Recipient from a third party without breach of any confidentiality obligation;",
-        "Is independently developed by the Recipient without use of or reference to the Confidential Information;",
-        "Is required to be disclosed by law, regulation, or court order, provided that the Recipient gives the Company reasonable advance notice of such requirement."
-    ]
-    
-    for i, exception in enumerate(exceptions, ord('a')):
-        doc.add_paragraph(f"({chr(i)}) {exception}", style='List Bullet')
-    
-    # Continue with other sections
-    add_remaining_clauses_to_docx(doc, contract_data)
-
-def add_remaining_clauses_to_story(story, contract_data, h1_style, h2_style, body_style):
-    """Add remaining clauses to PDF"""
-    # Note: This is a placeholder in the original code. Add actual clauses here.
-    story.append(Paragraph("2. OBLIGATIONS OF THE RECIPIENT", h1_style))
-    story.append(Paragraph("3. CONSTITUTIONAL AND STATUTORY COMPLIANCE", h1_style))
-    # TODO: Implement additional clauses (e.g., obligations, compliance, remedies, etc.)
-    # Example placeholder clauses:
-    story.append(Paragraph("2.1 The Recipient shall not disclose, publish, or otherwise reveal any of the Confidential Information received from the Company to any other party whatsoever except with the specific prior written authorization of the Company.", body_style))
-    story.append(Paragraph("3.1 This Agreement complies with the Protection of Personal Information Act 4 of 2013 (POPIA) and other relevant South African legislation.", body_style))
-
-def add_remaining_clauses_to_docx(doc, contract_data):
-    """Add remaining clauses to Word document"""
-    # Note: This is a placeholder in the original code. Add actual clauses here.
-    doc.add_heading("2. OBLIGATIONS OF THE RECIPIENT", level=1)
-    doc.add_heading("3. CONSTITUTIONAL AND STATUTORY COMPLIANCE", level=1)
-    # TODO: Implement additional clauses (e.g., obligations, compliance, remedies, etc.)
-    # Example placeholder clauses:
-    doc.add_paragraph("2.1 The Recipient shall not disclose, publish, or otherwise reveal any of the Confidential Information received from the Company to any other party whatsoever except with the specific prior written authorization of the Company.")
-    doc.add_paragraph("3.1 This Agreement complies with the Protection of Personal Information Act 4 of 2013 (POPIA) and other relevant South African legislation.")
-
-def add_signature_section_to_story(story, contract_data, h1_style, body_style):
-    """Add signature section to PDF"""
-    story.append(Spacer(1, 20))
-    story.append(Paragraph("IN WITNESS WHEREOF, the Parties have executed this Agreement on the date first written above.", body_style))
-    story.append(Spacer(1, 20))
-    
-    story.append(Paragraph("SIGNED AT _________________________ ON _________________________", body_style))
-    story.append(Spacer(1, 20))
-    
-    # Company signature
-    story.append(Paragraph("THE COMPANY:", body_style))
-    story.append(Spacer(1, 30))
-    story.append(Paragraph("_________________________________", body_style))
-    story.append(Paragraph(f"{contract_data['company_rep']}", body_style))
-    story.append(Paragraph(f"{contract_data['company_position']}", body_style))
-    story.append(Paragraph(f"{contract_data['company_name']}", body_style))
-    story.append(Spacer(1, 20))
-    
-    # Witness
-    story.append(Paragraph("WITNESS:", body_style))
-    story.append(Spacer(1, 30))
-    story.append(Paragraph("_________________________________", body_style))
-    story.append(Paragraph("Full Name:", body_style))
-    story.append(Paragraph("Date:", body_style))
-    story.append(Spacer(1, 20))
-    
-    # Recipient signature
-    story.append(Paragraph("THE RECIPIENT:", body_style))
-    story.append(Spacer(1, 30))
-    story.append(Paragraph("_________________________________", body_style))
-    story.append(Paragraph(f"{contract_data['other_name']}", body_style))
-    if contract_data['other_id']:
-        story.append(Paragraph(f"ID Number: {contract_data['other_id']}", body_style))
-    story.append(Spacer(1, 20))
-    
-    # Witness
-    story.append(Paragraph("WITNESS:", body_style))
-    story.append(Spacer(1, 30))
-    story.append(Paragraph("_________________________________", body_style))
-    story.append(Paragraph("Full Name:", body_style))
-    story.append(Paragraph("Date:", body_style))
-    story.append(Spacer(1, 20))
-    
-    # Legal disclaimer
-    story.append(Paragraph("LEGAL DISCLAIMER:", h1_style))
-    story.append(Paragraph("This NDA has been generated to comply with South African law as of 2024. However, legal requirements may change, and specific circumstances may require additional provisions. It is recommended to have this agreement reviewed by a qualified South African attorney before execution.", body_style))
-
-def generate_nda_text(contract_data):
-    """Generate plain text version of the NDA"""
-    current_date = datetime.now().strftime("%d %B %Y")
-    
-    # Determine duration text
-    if contract_data['duration_years'] == "Indefinite":
-        duration_text = "indefinitely"
-        duration_clause = "This obligation shall survive indefinitely"
-    else:
-        duration_text = f"{contract_data['duration_years']} years"
-        duration_clause = f"This obligation shall survive for a period of {contract_data['duration_years']} years"
-    
-    if contract_data['post_employment'] and contract_data['contract_type'] == "Employee NDA":
-        duration_clause += " from the termination of employment"
-    elif contract_data['contract_type'] == "Contractor NDA":
-        duration_clause += " from the completion or termination of the contractual relationship"
-    else:
-        duration_clause += " from the date of this Agreement"
-    
-    # Build confidential information list
-    conf_info_list = []
-    for i, item in enumerate(contract_data['confidential_info'], 1):
-        conf_info_list.append(f"        {i}. {item};")
-    
-    if contract_data['additional_info']:
-        conf_info_list.append(f"        {len(contract_data['confidential_info']) + 1}. {contract_data['additional_info']};")
-    
-    conf_info_text = "\n".join(conf_info_list)
-    
-    # Corrected recipient text
-    recipient_text = f"(2) {contract_data['other_name'].upper()}{f', ID Number: {contract_data['other_id']}' if contract_data['other_id'] else ''}, with address at {contract_data['other_address']} (hereinafter referred to as \"the Recipient\" or \"Receiving Party\"){f', employed as {contract_data['job_title']} from {contract_data['employment_date'].strftime('%d %B %Y')}' if contract_data['contract_type'] == 'Employee NDA' else ''}."
-
-    contract = f"""
+# Plain-text NDA; {recitals} and {exceptions} are filled in per contract type when
+# _NDA_TEMPLATES is built, the remaining fields per call by generate_nda_text
+_NDA_TEXT_TEMPLATE = """
 NON-DISCLOSURE AGREEMENT
 (Compliant with South African Law)
 
@@ -658,7 +693,7 @@ THIS AGREEMENT is made on {current_date}
 
 BETWEEN:
 
-(1) {contract_data['company_name'].upper()} (Registration Number: {contract_data['company_reg']}), a company duly incorporated in accordance with the laws of the Republic of South Africa, with its registered address at {contract_data['company_address']} (hereinafter referred to as "the Company" or "Disclosing Party"), represented herein by {contract_data['company_rep']}, {contract_data['company_position']}, who warrants that he/she has the necessary authority to bind the Company; and
+(1) {company_name_upper} (Registration Number: {company_reg}), a company duly incorporated in accordance with the laws of the Republic of South Africa, with its registered address at {company_address} (hereinafter referred to as "the Company" or "Disclosing Party"), represented herein by {company_rep}, {company_position}, who warrants that he/she has the necessary authority to bind the Company; and
 
 {recipient_text}
 
@@ -666,11 +701,7 @@ BETWEEN:
 
 RECITALS
 
-WHEREAS, the Company possesses certain confidential and proprietary information, trade secrets, and intellectual property that constitute valuable business assets;
-
-WHEREAS, the Recipient {f"is employed by" if contract_data['contract_type'] == "Employee NDA" else "will be engaged by"} the Company and will have access to such confidential information in the course of {"employment" if contract_data['contract_type'] == "Employee NDA" else "the engagement"};
-
-WHEREAS, the Parties wish to protect the confidentiality of such information in accordance with the laws of the Republic of South Africa, including but not limited to the Constitution of South Africa (1996), Labour Relations Act 66 of 1995, Basic Conditions of Employment Act 75 of 1997, Protection of Personal Information Act 4 of 2013, Competition Act 89 of 1998, and Protected Disclosures Act 26 of 2000;
+{recitals}
 
 NOW THEREFORE, the Parties agree as follows:
 
@@ -681,11 +712,7 @@ NOW THEREFORE, the Parties agree as follows:
 {conf_info_text}
 
 1.2 Confidential Information shall not include information that:
-    (a) Is or becomes publicly available through no breach of this Agreement by the Recipient;
-    (b) Was rightfully known by the Recipient before disclosure by the Company;
-    (c) Is rightfully received by the Recipient from a third party without breach of any confidentiality obligation;
-    (d) Is independently developed by the Recipient without use of or reference to the Confidential Information;
-    (e) Is required to be disclosed by law, regulation, or court order, provided that the Recipient gives the Company reasonable advance notice of such requirement.
+{exceptions}
 
 2. OBLIGATIONS OF THE RECIPIENT
 
@@ -697,9 +724,9 @@ SIGNED AT _________________________ ON _________________________
 
 THE COMPANY:
 _________________________________
-{contract_data['company_rep']}
-{contract_data['company_position']}
-{contract_data['company_name']}
+{company_rep}
+{company_position}
+{company_name}
 
 WITNESS:
 _________________________________
@@ -708,8 +735,8 @@ Date:
 
 THE RECIPIENT:
 _________________________________
-{contract_data['other_name']}
-{f"ID Number: {contract_data['other_id']}" if contract_data['other_id'] else ''}
+{other_name}
+{other_id_line}
 
 WITNESS:
 _________________________________
@@ -718,7 +745,57 @@ Date:
 
 LEGAL DISCLAIMER: This NDA has been generated to comply with South African law as of 2024. However, legal requirements may change, and specific circumstances may require additional provisions. It is recommended to have this agreement reviewed by a qualified South African attorney before execution.
 """
-    return contract
+
+def _text_template(contract_type):
+    """Specialize the plain-text NDA template for a contract type"""
+    recitals = "\n\n".join(_RECITALS_BY_TYPE[contract_type])
+    exceptions = "\n".join(f"    {label} {exception}" for label, exception in zip(_ALPHA_LABELS, _EXCEPTIONS))
+    return _NDA_TEXT_TEMPLATE.replace("{recitals}", recitals).replace("{exceptions}", exceptions)
+
+_NDA_TEMPLATES = {
+    contract_type: _text_template(contract_type)
+    for contract_type in _CONTRACT_TYPES
+}
+
+def _text_context(contract_data, current_date):
+    """Collect the placeholder values for the plain text template, and only those"""
+    # Build confidential information list
+    items = contract_data['confidential_info']
+    if contract_data['additional_info']:
+        items = [*items, contract_data['additional_info']]
+    conf_info_text = "\n".join([f"        {i}. {item};" for i, item in enumerate(items, 1)])
+    
+    # Optional recipient fragments, resolved once
+    other_id = contract_data['other_id']
+    id_suffix = f", ID Number: {other_id}" if other_id else ""
+    other_id_line = f"ID Number: {other_id}" if other_id else ""
+    if contract_data['contract_type'] == "Employee NDA":
+        employment_suffix = f", employed as {contract_data['job_title']} from {_fmt_date(contract_data['employment_date'])}"
+    else:
+        employment_suffix = ""
+    
+    # Corrected recipient text
+    recipient_text = f"(2) {contract_data['other_name'].upper()}{id_suffix}, with address at {contract_data['other_address']} (hereinafter referred to as \"the Recipient\" or \"Receiving Party\"){employment_suffix}."
+
+    return {
+        'current_date': current_date,
+        'company_name': contract_data['company_name'],
+        'company_name_upper': contract_data['company_name'].upper(),
+        'company_reg': contract_data['company_reg'],
+        'company_address': contract_data['company_address'],
+        'company_rep': contract_data['company_rep'],
+        'company_position': contract_data['company_position'],
+        'recipient_text': recipient_text,
+        'conf_info_text': conf_info_text,
+        'other_name': contract_data['other_name'],
+        'other_id_line': other_id_line
+    }
+
+def generate_nda_text(contract_data, current_date=None):
+    """Generate plain text version of the NDA"""
+    if current_date is None:
+        current_date = _fmt_date(datetime.now().date())
+    return _NDA_TEMPLATES[contract_data['contract_type']].format_map(_text_context(contract_data, current_date))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file